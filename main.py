@@ -1,36 +1,53 @@
 # gpu_temp_monitor.py
 
+import atexit
 import psutil
 import time
 import os
 import re
+import select
+import shutil
 import sys
+import signal
+import threading
 import argparse
-import json
-from datetime import datetime
-
-# Attempt to import pynvml, which is needed for detailed NVIDIA GPU info
-try:
-    # Explicitly import all necessary functions and constants from pynvml
-    from pynvml import (
-        nvmlInit,
-        nvmlDeviceGetCount,
-        nvmlDeviceGetHandleByIndex,
-        nvmlDeviceGetName,
-        nvmlDeviceGetTemperature,
-        nvmlShutdown,
-        NVMLError,
-        NVML_ERROR_NOT_FOUND,
-        NVML_TEMPERATURE_GPU
-    )
-    PYNVML_AVAILABLE = True
-except ImportError:
-    PYNVML_AVAILABLE = False
-except NVMLError_LibraryNotFound:
-    PYNVML_AVAILABLE = False
-except Exception as e:
-    sys.stderr.write(f"Warning: Failed to import pynvml components: {e}. pynvml features will be unavailable.\n")
-    PYNVML_AVAILABLE = False
+
+# pynvml, which is needed for detailed NVIDIA GPU info, is imported on first use by
+# load_pynvml() so runs that never reach NVML (e.g. --help) skip it. None until attempted.
+PYNVML_AVAILABLE = None
+
+def load_pynvml():
+    """
+    Imports the pynvml functions and constants used here into module globals.
+    Returns whether pynvml is usable; the outcome is memoized in PYNVML_AVAILABLE.
+    """
+    global PYNVML_AVAILABLE
+    global nvmlInit, nvmlDeviceGetCount, nvmlDeviceGetHandleByIndex, nvmlDeviceGetName
+    global nvmlDeviceGetTemperature, nvmlShutdown, NVMLError, NVML_ERROR_NOT_FOUND, NVML_TEMPERATURE_GPU
+
+    if PYNVML_AVAILABLE is not None:
+        return PYNVML_AVAILABLE
+
+    try:
+        # Explicitly import all necessary functions and constants from pynvml
+        from pynvml import (
+            nvmlInit,
+            nvmlDeviceGetCount,
+            nvmlDeviceGetHandleByIndex,
+            nvmlDeviceGetName,
+            nvmlDeviceGetTemperature,
+            nvmlShutdown,
+            NVMLError,
+            NVML_ERROR_NOT_FOUND,
+            NVML_TEMPERATURE_GPU
+        )
+        PYNVML_AVAILABLE = True
+    except ImportError:
+        PYNVML_AVAILABLE = False
+    except Exception as e:
+        sys.stderr.write(f"Warning: Failed to import pynvml components: {e}. pynvml features will be unavailable.\n")
+        PYNVML_AVAILABLE = False
+    return PYNVML_AVAILABLE
 
 
 # Define ANSI escape codes directly for cross-platform console coloring
@@ -41,169 +58,562 @@ ANSI_YELLOW = "\x1b[33m"
 ANSI_BLUE = "\x1b[34m"
 ANSI_CYAN = "\x1b[36m"
 ANSI_WHITE = "\x1b[37m"
+# Cursor home + clear to end of screen; avoids the flicker of os.system('clear/cls')
+CLEAR_SCREEN = "\x1b[H\x1b[J"
+
+# Temperature colors, indexed by (temp >= 60) + (temp >= 80): green below 60, yellow below 80, red otherwise
+TEMP_COLORS = (ANSI_GREEN, ANSI_YELLOW, ANSI_RED)
+
+# Thresholds used when the backend does not report its own
+DEFAULT_HIGH_TEMP = 85.0
+DEFAULT_CRITICAL_TEMP = 95.0
+
+# psutil sensor keys that always belong to a GPU; extend this if your GPU reports under another name
+PSUTIL_GPU_SENSOR_KEYS = ['amdgpu', 'nouveau', 'gpu', 'radeon']
+# Matches a GPU sensor key or label anywhere in the string, case-insensitively, in one pass
+GPU_SENSOR_RE = re.compile("|".join(map(re.escape, PSUTIL_GPU_SENSOR_KEYS + ['video'])), re.IGNORECASE)
+
+# Seconds between refreshes in interactive mode
+POLL_INTERVAL = 2.0
+# --adaptive: after ADAPTIVE_STABLE_POLLS polls in which no GPU moved by STABLE_TEMP_DELTA or more,
+# poll every ADAPTIVE_IDLE_INTERVAL seconds; a move above RESUME_TEMP_DELTA restores POLL_INTERVAL
+ADAPTIVE_IDLE_INTERVAL = 5.0
+ADAPTIVE_STABLE_POLLS = 3
+STABLE_TEMP_DELTA = 0.5
+RESUME_TEMP_DELTA = 1.0
+# On exit, how long to wait for the poller to finish an in-flight read before NVML is shut down
+POLLER_JOIN_TIMEOUT = 1.0
+# Seconds between NVML device-count checks; GPUs are rarely hotplugged
+NVML_REPROBE_INTERVAL = 60.0
+# A psutil scan younger than this is reused instead of rescanning sysfs; kept below POLL_INTERVAL
+PSUTIL_SCAN_TTL = 1.5
+
+# Display layout; everything that does not depend on the readings is built once here
+GPU_LABEL_WIDTH = 35 # wide enough for long GPU names
+TEMP_VALUE_WIDTH = 7 # for X.X°C
+LINE_LENGTH = GPU_LABEL_WIDTH + 3 * (TEMP_VALUE_WIDTH + 1) + 5 # Label + 3 temps + spacing
+
+# Frames are assembled as bytes in the console's encoding and written to sys.stdout.buffer
+OUTPUT_ENCODING = getattr(sys.stdout, "encoding", None) or "utf-8"
 
-def clear_console():
+def encode_output(text):
+    return text.encode(OUTPUT_ENCODING, "replace")
+
+CLEAR_SCREEN_BYTES = encode_output(CLEAR_SCREEN)
+TITLE_BYTES = encode_output(f"{ANSI_CYAN}--- GPU Temperature Monitor ---{ANSI_RESET}\n")
+SEPARATOR_BYTES = encode_output("-" * LINE_LENGTH + "\n")
+MESSAGE_SEPARATOR_BYTES = encode_output("-" * 55 + "\n")
+HEADER_BYTES = encode_output(f"{ANSI_BLUE}{'GPU':<{GPU_LABEL_WIDTH}}{'Current':<{TEMP_VALUE_WIDTH+1}}"
+                             f"{'High':<{TEMP_VALUE_WIDTH+1}}{'Critical':<{TEMP_VALUE_WIDTH+1}}{ANSI_RESET}\n")
+# Screen line (1-based) of the first GPU row: title, separator, header, separator come first
+FIRST_ROW_LINE = 5
+# In diff mode, repaint the whole screen at least this often to recover from any corruption
+FULL_REPAINT_EVERY = 30
+TEMP_COLORS_BYTES = tuple(encode_output(color) for color in TEMP_COLORS)
+DEGREE_C_BYTES = encode_output("°C")
+# Byte padding for a temperature cell; "°" may take more than one byte in the output encoding
+TEMP_CELL_WIDTH = TEMP_VALUE_WIDTH + 1 + len(DEGREE_C_BYTES) - len("°C")
+# Arguments: padded label, color, then the current/high/critical cells
+ROW_FMT_BYTES = encode_output(f"{ANSI_WHITE}%s{ANSI_RESET}"
+                              f"%s%-{TEMP_CELL_WIDTH}s{ANSI_RESET}"
+                              f"%-{TEMP_CELL_WIDTH}s{ANSI_RESET}"
+                              f"%-{TEMP_CELL_WIDTH}s{ANSI_RESET}\n")
+
+def decode_gpu_name(gpu_name_bytes):
+    """Returns a GPU name as str; older pynvml releases hand it back as bytes."""
+    if isinstance(gpu_name_bytes, bytes):
+        return gpu_name_bytes.decode('utf-8')
+    return gpu_name_bytes
+
+def describe_nvml_error(error):
+    """Builds the user-facing message for an NVMLError raised while talking to the driver."""
+    message = f"pynvml error: {error}. Falling back to psutil."
+    if error.value == NVML_ERROR_NOT_FOUND:
+        message += " (NVIDIA driver not loaded or no NVIDIA GPUs found)"
+    return message
+
+
+class NvmlSession:
     """
-    Moves the cursor to the top-left of the console and clears the screen from that point.
-    This prevents flickering compared to os.system('clear/cls').
-    Uses raw ANSI escape codes.
+    Keeps NVML initialized for the lifetime of the process.
+    nvmlInit() and device enumeration happen once here; each poll then only needs
+    nvmlDeviceGetTemperature() on the cached handles. nvmlShutdown() runs at exit.
+    The device count is rechecked every NVML_REPROBE_INTERVAL seconds to pick up hotplug.
     """
-    sys.stdout.write("\x1b[H\x1b[J")
-    sys.stdout.flush()
-
-def get_temp_color(temperature):
-    """Returns an ANSI color code based on the temperature value."""
-    if temperature < 60:
-        return ANSI_GREEN
-    elif temperature < 80:
-        return ANSI_YELLOW
-    else:
-        return ANSI_RED
 
-def get_gpu_data_structured():
+    def __init__(self):
+        self.handles = []
+        self.names = []
+        self.error = None
+        self.detection_method = "None"
+        # True once NVML has found at least one GPU; polls then never touch psutil unless an NVML read fails.
+        self.nvml_ok = False
+        # Everything except "current" is fixed per device; polls copy these and fill it in.
+        self._static = []
+        self._initialized = False
+        self._enumerated_at = time.monotonic()
+
+        if load_pynvml():
+            self._init_devices()
+
+    def _init_devices(self):
+        try:
+            nvmlInit()
+            atexit.register(nvmlShutdown)
+            self._initialized = True
+            self._enumerate_devices()
+        except NVMLError as error:
+            self.error = describe_nvml_error(error)
+            self.detection_method = "pynvml_failed_fallback_psutil"
+        except Exception as e:
+            self.error = f"Unexpected pynvml issue: {e}. Falling back to psutil."
+            self.detection_method = "pynvml_exception_fallback_psutil"
+
+    def _enumerate_devices(self):
+        handles = [nvmlDeviceGetHandleByIndex(i) for i in range(nvmlDeviceGetCount())]
+        names = [decode_gpu_name(nvmlDeviceGetName(handle)) for handle in handles]
+        self._static = [{
+            "label": gpu_name,
+            "current": None,
+            "high": DEFAULT_HIGH_TEMP,
+            "critical": DEFAULT_CRITICAL_TEMP,
+            "detection_source": "pynvml"
+        } for gpu_name in names]
+        self.handles, self.names = handles, names
+        self.nvml_ok = bool(handles)
+        self._enumerated_at = time.monotonic()
+
+    def refresh_devices(self):
+        """Re-enumerates devices if NVML_REPROBE_INTERVAL has passed and the device count changed."""
+        if not self._initialized or time.monotonic() - self._enumerated_at < NVML_REPROBE_INTERVAL:
+            return
+        self._enumerated_at = time.monotonic()
+        try:
+            if nvmlDeviceGetCount() != len(self.handles):
+                self._enumerate_devices()
+        except Exception:
+            pass # keep the current devices; a real failure shows up in the next temperature read
+
+    def read(self, data):
+        """Appends a reading for every NVML device to data; on failure records the error and fallback method."""
+        try:
+            data["gpu_detection_method"] = "pynvml"
+            for static_entry, handle in zip(self._static, self.handles):
+                entry = static_entry.copy()
+                entry["current"] = float(nvmlDeviceGetTemperature(handle, NVML_TEMPERATURE_GPU))
+                data["gpu_temps"].append(entry)
+        except NVMLError as error:
+            data["error"] = describe_nvml_error(error)
+            data["gpu_detection_method"] = "pynvml_failed_fallback_psutil"
+        except Exception as e:
+            data["error"] = f"Unexpected pynvml issue: {e}. Falling back to psutil."
+            data["gpu_detection_method"] = "pynvml_exception_fallback_psutil"
+
+
+class PsutilSession:
+    """
+    Works out once which psutil sensors belong to a GPU and caches their static part
+    (label, thresholds, source), so each poll only reads sensor.current for those sensors.
+    Probing is deferred to the first poll that needs psutil and reuses that poll's
+    sensors_temperatures() result. If the probe finds no GPU sensors, later polls skip
+    the sysfs scan altogether.
+    """
+
+    def __init__(self):
+        # (key, index within key, entry template) for every GPU sensor; None until probed
+        self.gpu_sensors = None
+        # Sensor keys seen by the most recent scan, reported when no GPU is found
+        self.available_sensor_keys = []
+        self._last_raw = {}
+        self._last_raw_ts = None
+
+    def sensors_temperatures(self):
+        """psutil.sensors_temperatures(), reusing the last successful result for PSUTIL_SCAN_TTL seconds."""
+        now = time.monotonic()
+        if self._last_raw_ts is not None and now - self._last_raw_ts < PSUTIL_SCAN_TTL:
+            return self._last_raw
+        self._last_raw = psutil.sensors_temperatures()
+        self._last_raw_ts = now
+        return self._last_raw
+
+    def probe(self, raw_temps):
+        """Classifies the sensors in raw_temps and builds the entry template for each GPU sensor."""
+        self.gpu_sensors = []
+        psutil_gpu_counter = 1
+
+        for key, sensors_list in raw_temps.items():
+            for index, sensor in enumerate(sensors_list):
+                if GPU_SENSOR_RE.search(key) or (sensor.label and GPU_SENSOR_RE.search(sensor.label)):
+                    self.gpu_sensors.append((key, index, {
+                        "label": sensor.label.strip() if sensor.label else f"GPU {psutil_gpu_counter}",
+                        "current": None,
+                        "high": float(sensor.high) if sensor.high is not None else DEFAULT_HIGH_TEMP,
+                        "critical": float(sensor.critical) if sensor.critical is not None else DEFAULT_CRITICAL_TEMP,
+                        "detection_source": f"psutil ({key})"
+                    }))
+                    psutil_gpu_counter += 1
+
+    def read(self):
+        """Returns the GPU entries for this poll, probing first if this is the first call."""
+        if self.gpu_sensors is not None and not self.gpu_sensors:
+            return []
+
+        raw_temps = self.sensors_temperatures()
+        self.available_sensor_keys = list(raw_temps.keys())
+        if self.gpu_sensors is None:
+            self.probe(raw_temps)
+
+        entries = []
+        for key, index, static_entry in self.gpu_sensors:
+            sensors_list = raw_temps.get(key)
+            if not sensors_list or index >= len(sensors_list):
+                continue
+            current = sensors_list[index].current
+            if current is None:
+                continue
+            entry = static_entry.copy()
+            entry["current"] = float(current)
+            entries.append(entry)
+        return entries
+
+
+def get_gpu_data_structured(nvml_session, psutil_session, need_timestamp=False):
     """
     Fetches and structures GPU temperature data into a Python dictionary.
-    Prioritizes pynvml for NVIDIA GPUs, then falls back to psutil.
+    Prioritizes pynvml for NVIDIA GPUs (via the already initialized nvml_session),
+    then falls back to psutil.
+    The "timestamp" field is only filled in when need_timestamp is set (the --json output).
     """
-    data = {
-        "timestamp": datetime.now().isoformat(),
-        "gpu_temps": [],
-        "gpu_detection_method": "None"
-    }
+    data = {}
+    if need_timestamp:
+        from datetime import datetime
+        data["timestamp"] = datetime.now().isoformat()
+    data["gpu_temps"] = []
+    data["gpu_detection_method"] = "None"
 
     try:
         # --- Attempt to get NVIDIA GPU data using pynvml ---
-        if PYNVML_AVAILABLE:
-            try:
-                nvmlInit()
-                device_count = nvmlDeviceGetCount()
-                if device_count > 0:
-                    data["gpu_detection_method"] = "pynvml"
-                    for i in range(device_count):
-                        handle = nvmlDeviceGetHandleByIndex(i)
-                        
-                        gpu_name_bytes = nvmlDeviceGetName(handle)
-                        if isinstance(gpu_name_bytes, bytes):
-                            gpu_name = gpu_name_bytes.decode('utf-8')
-                        else:
-                            gpu_name = gpu_name_bytes
-                        
-                        temp_c = nvmlDeviceGetTemperature(handle, NVML_TEMPERATURE_GPU)
-                        
-                        high_temp = 85.0
-                        critical_temp = 95.0
-
-                        data["gpu_temps"].append({
-                            "label": gpu_name,
-                            "current": float(temp_c),
-                            "high": high_temp,
-                            "critical": critical_temp,
-                            "detection_source": "pynvml"
-                        })
-                nvmlShutdown()
-            except NVMLError as error:
-                data["error"] = f"pynvml error: {error}. Falling back to psutil."
-                data["gpu_detection_method"] = "pynvml_failed_fallback_psutil"
-                if error.value == NVML_ERROR_NOT_FOUND:
-                    data["error"] += " (NVIDIA driver not loaded or no NVIDIA GPUs found)"
-            except Exception as e:
-                data["error"] = f"Unexpected pynvml issue: {e}. Falling back to psutil."
-                data["gpu_detection_method"] = "pynvml_exception_fallback_psutil"
+        nvml_session.refresh_devices()
+        if nvml_session.nvml_ok:
+            nvml_session.read(data)
+        elif nvml_session.error:
+            data["error"] = nvml_session.error
+            data["gpu_detection_method"] = nvml_session.detection_method
 
         # --- Fallback to psutil.sensors_temperatures() if pynvml failed or not available ---
-        if not data["gpu_temps"] or data["gpu_detection_method"] in ["pynvml_failed_fallback_psutil", "pynvml_exception_fallback_psutil"]:
-            raw_temps = psutil.sensors_temperatures()
-            
-            psutil_gpu_sensor_keys = ['amdgpu', 'nouveau', 'gpu', 'radeon'] 
-            
-            psutil_gpu_counter = 1
-            psutil_found_gpu_data = False
-
-            for key, sensors_list in raw_temps.items():
-                for sensor in sensors_list:
-                    is_gpu_sensor = False
-                    if hasattr(sensor, 'current') and sensor.current is not None:
-                        if key in psutil_gpu_sensor_keys:
-                            is_gpu_sensor = True
-                        elif 'gpu' in key.lower() or 'video' in key.lower():
-                            is_gpu_sensor = True
-                        elif 'temp' in key.lower() and hasattr(sensor, 'label') and 'gpu' in sensor.label.lower():
-                            is_gpu_sensor = True
-
-                    if is_gpu_sensor:
-                        gpu_label = sensor.label.strip() if sensor.label else f"GPU {psutil_gpu_counter}"
-                        data["gpu_temps"].append({
-                            "label": gpu_label,
-                            "current": float(sensor.current),
-                            "high": float(sensor.high) if sensor.high is not None else 85.0,
-                            "critical": float(sensor.critical) if sensor.critical is not None else 95.0,
-                            "detection_source": f"psutil ({key})"
-                        })
-                        psutil_gpu_counter += 1
-                        psutil_found_gpu_data = True
-            
-            if psutil_found_gpu_data and data["gpu_detection_method"] not in ["pynvml"]:
+        # Skipped entirely while NVML is delivering readings.
+        if data["gpu_detection_method"] != "pynvml":
+            psutil_gpu_temps = psutil_session.read()
+            data["gpu_temps"].extend(psutil_gpu_temps)
+
+            if psutil_gpu_temps:
                 data["gpu_detection_method"] = "psutil"
-            elif not psutil_found_gpu_data and data["gpu_detection_method"] not in ["pynvml"]:
+            else:
                 data["gpu_detection_method"] = "None"
                 if "error" not in data or "Falling back to psutil" in data["error"]:
                     data["error"] = data.get("error", "") + " No GPU temperature data found via psutil either."
-                data["available_sensor_keys"] = list(raw_temps.keys())
+                data["available_sensor_keys"] = psutil_session.available_sensor_keys
 
     except Exception as e:
         data["error"] = f"General error during GPU data collection: {e}"
         data["gpu_detection_method"] = "error"
         try:
-            data["available_sensor_keys"] = list(psutil.sensors_temperatures().keys())
+            data["available_sensor_keys"] = list(psutil_session.sensors_temperatures().keys())
         except Exception:
             data["available_sensor_keys"] = []
     
     return data
 
 
-def display_gpu_temperatures(gpu_data):
+class FrameBuffer:
+    """
+    Byte buffer reused for every interactive frame.
+    Appends overwrite the previous frame in place instead of clearing the bytearray (which
+    would shrink and later regrow its storage), so once it has grown to the largest frame
+    the display loop no longer allocates a buffer per frame.
+    """
+
+    def __init__(self, capacity=4096):
+        self._buffer = bytearray(capacity)
+        self._length = 0
+
+    def clear(self):
+        self._length = 0
+
+    def __len__(self):
+        return self._length
+
+    def __iadd__(self, chunk):
+        end = self._length + len(chunk)
+        # Same-size slice assignment while it fits; grows the bytearray only past its current size
+        self._buffer[self._length:end] = chunk
+        self._length = end
+        return self
+
+    def view(self):
+        """Returns a memoryview of the current frame; release it before appending again."""
+        return memoryview(self._buffer)[:self._length]
+
+_FRAME = FrameBuffer()
+
+def get_tty_fd():
+    """
+    Returns stdout's file descriptor when it is a terminal on a POSIX system, else None.
+    Redirected output and Windows consoles keep going through sys.stdout.
+    """
+    if os.name != "posix":
+        return None
+    try:
+        return sys.stdout.fileno() if sys.stdout.isatty() else None
+    except (AttributeError, OSError, ValueError):
+        return None
+
+STDOUT_TTY_FD = get_tty_fd()
+
+def write_frame(frame):
+    """
+    Writes an encoded frame to stdout in one call, bypassing the text layer's encoder.
+    On a terminal the frame goes straight to the file descriptor with os.write(), skipping
+    the buffered writer and its lock as well.
+    """
+    sys.stdout.flush() # keep ordering with anything written through sys.stdout
+    stdout_buffer = getattr(sys.stdout, "buffer", None)
+    with frame.view() as frame_bytes:
+        if STDOUT_TTY_FD is not None:
+            while frame_bytes:
+                frame_bytes = frame_bytes[os.write(STDOUT_TTY_FD, frame_bytes):]
+            return
+        if stdout_buffer is None:
+            sys.stdout.write(str(frame_bytes, OUTPUT_ENCODING))
+            sys.stdout.flush()
+            return
+        stdout_buffer.write(frame_bytes)
+    stdout_buffer.flush()
+
+# What the terminal currently shows in diff mode; "rows" is None when the next frame must be a full repaint
+_display_state = {"rows": None, "frames_since_repaint": 0}
+
+def request_full_repaint(*_):
+    """Makes the next diff-mode frame repaint everything. Also used as the SIGWINCH handler."""
+    _display_state["repaint"] = True
+
+def table_fits_terminal(gpu_sensors_data):
+    """
+    Whether the whole table fits the terminal without wrapping or scrolling. Diff mode addresses
+    rows by screen line, which is only valid when each table line takes exactly one and the
+    screen has not scrolled.
+    """
+    terminal_size = shutil.get_terminal_size()
+    longest_label = max(len(gpu_info['label']) for gpu_info in gpu_sensors_data)
+    row_width = max(longest_label, GPU_LABEL_WIDTH) + 3 * (TEMP_VALUE_WIDTH + 1)
+    return (max(LINE_LENGTH, row_width) <= terminal_size.columns
+            and FIRST_ROW_LINE + len(gpu_sensors_data) + 1 <= terminal_size.lines)
+
+def format_gpu_rows(gpu_sensors_data):
+    """Returns the encoded table row for every GPU."""
+    return [ROW_FMT_BYTES % (
+        encode_output(gpu_info['label'].ljust(GPU_LABEL_WIDTH)),
+        TEMP_COLORS_BYTES[(gpu_info["current"] >= 60) + (gpu_info["current"] >= 80)],
+        b"%.1f" % gpu_info["current"] + DEGREE_C_BYTES,
+        b"%.1f" % gpu_info['high'] + DEGREE_C_BYTES,
+        b"%.1f" % gpu_info['critical'] + DEGREE_C_BYTES
+    ) for gpu_info in gpu_sensors_data]
+
+def display_gpu_temperatures(gpu_data, clear_screen=False, only_changed_rows=False):
     """
     Displays GPU temperature data in a formatted console output.
     Takes structured data from get_gpu_data_structured().
+    The whole frame (including the screen clear, if requested) is built as bytes
+    and goes out in a single write.
+    With only_changed_rows (interactive mode), rows identical to the previous frame are
+    not resent; changed rows are rewritten in place with cursor positioning instead of
+    repainting the screen.
     """
-    sys.stdout.write(f"{ANSI_CYAN}--- GPU Temperature Monitor ---{ANSI_RESET}\n")
+    frame = _FRAME
+    frame.clear()
+    # A single pop() reads and clears the flag, so a SIGWINCH arriving mid-frame is never lost
+    repaint_requested = _display_state.pop("repaint", False)
 
     gpu_sensors_data = gpu_data.get("gpu_temps", [])
+    rows = format_gpu_rows(gpu_sensors_data) if gpu_sensors_data else None
+    previous_rows = _display_state["rows"]
+    _display_state["rows"] = rows if only_changed_rows else None
 
-    if gpu_sensors_data:
-        # Define widths for display
-        GPU_LABEL_WIDTH = 35 # <--- FIX: Increased width for long GPU names
-        TEMP_VALUE_WIDTH = 7 # for X.X°C
-        
-        # Recalculate LINE_LENGTH based on the new GPU_LABEL_WIDTH
-        LINE_LENGTH = GPU_LABEL_WIDTH + 3 * (TEMP_VALUE_WIDTH + 1) + 5 # Label + 3 temps + spacing
-
-        sys.stdout.write("-" * LINE_LENGTH + "\n")
-        # Header for GPU section
-        sys.stdout.write(f"{ANSI_BLUE}{'GPU':<{GPU_LABEL_WIDTH}}{'Current':<{TEMP_VALUE_WIDTH+1}}{'High':<{TEMP_VALUE_WIDTH+1}}{'Critical':<{TEMP_VALUE_WIDTH+1}}{ANSI_RESET}\n")
-        sys.stdout.write("-" * LINE_LENGTH + "\n")
-
-        for gpu_info in gpu_sensors_data:
-            gpu_color = get_temp_color(gpu_info["current"])
-            current_gpu_str = f"{gpu_info['current']:.1f}°C"
-            high_gpu_str = f"{gpu_info['high']:.1f}°C"
-            critical_gpu_str = f"{gpu_info['critical']:.1f}°C"
-
-            sys.stdout.write(f"{ANSI_WHITE}{gpu_info['label']:<{GPU_LABEL_WIDTH}}{ANSI_RESET}"
-                             f"{gpu_color}{current_gpu_str:<{TEMP_VALUE_WIDTH+1}}{ANSI_RESET}"
-                             f"{high_gpu_str:<{TEMP_VALUE_WIDTH+1}}{ANSI_RESET}"
-                             f"{critical_gpu_str:<{TEMP_VALUE_WIDTH+1}}{ANSI_RESET}\n")
-        sys.stdout.write("-" * LINE_LENGTH + "\n")
+    if (only_changed_rows and not repaint_requested and rows and previous_rows
+            and len(rows) == len(previous_rows)
+            and _display_state["frames_since_repaint"] < FULL_REPAINT_EVERY
+            and table_fits_terminal(gpu_sensors_data)):
+        _display_state["frames_since_repaint"] += 1
+        for line, (row, previous_row) in enumerate(zip(rows, previous_rows), FIRST_ROW_LINE):
+            if row != previous_row:
+                frame += b"\x1b[%d;1H\x1b[K" % line
+                frame += row
+        if len(frame):
+            # Park the cursor below the table again, where a full repaint leaves it
+            frame += b"\x1b[%d;1H" % (FIRST_ROW_LINE + len(rows) + 1)
+            write_frame(frame)
+        return
+
+    _display_state["frames_since_repaint"] = 0
+    if clear_screen:
+        frame += CLEAR_SCREEN_BYTES
+    frame += TITLE_BYTES
+
+    if rows:
+        frame += SEPARATOR_BYTES
+        frame += HEADER_BYTES
+        frame += SEPARATOR_BYTES
+        # All rows are joined in one call and appended to the frame once
+        frame += b"".join(rows)
+        frame += SEPARATOR_BYTES
     elif "error" in gpu_data:
-        sys.stdout.write(f"{ANSI_YELLOW}{gpu_data['error']}{ANSI_RESET}\n")
+        frame += encode_output(f"{ANSI_YELLOW}{gpu_data['error']}{ANSI_RESET}\n")
         if "available_sensor_keys" in gpu_data:
-            sys.stdout.write(f"{ANSI_YELLOW}Available sensor keys: {', '.join(gpu_data['available_sensor_keys'])}{ANSI_RESET}\n")
-        sys.stdout.write("-" * 55 + "\n")
+            frame += encode_output(f"{ANSI_YELLOW}Available sensor keys: {', '.join(gpu_data['available_sensor_keys'])}{ANSI_RESET}\n")
+        frame += MESSAGE_SEPARATOR_BYTES
     else:
-        sys.stdout.write(f"{ANSI_YELLOW}No GPU temperature data available.{ANSI_RESET}\n")
-        sys.stdout.write("-" * 55 + "\n")
+        frame += encode_output(f"{ANSI_YELLOW}No GPU temperature data available.{ANSI_RESET}\n")
+        frame += MESSAGE_SEPARATOR_BYTES
+
+    write_frame(frame)
+
+
+class Ticker:
+    """
+    Wakes up on fixed interval boundaries of the monotonic clock, so the time spent
+    reading sensors does not push later refreshes back the way time.sleep(2) did.
+    Uses a periodic timerfd where the os module provides one (Linux, Python 3.13+)
+    and a monotonic deadline otherwise. Either way, interrupt() wakes a blocked wait().
+    """
+
+    def __init__(self, interval=POLL_INTERVAL, initial=None):
+        self.interval = interval
+        if initial is None:
+            initial = interval
+        self._timer_fd = None
+        self._wake_fd = None
+        self._interrupted = threading.Event()
+        self._next_tick = time.monotonic() + initial
+
+        if hasattr(os, "timerfd_create"):
+            try:
+                self._timer_fd = os.timerfd_create(time.CLOCK_MONOTONIC)
+                self._wake_fd = os.eventfd(0)
+                os.timerfd_settime(self._timer_fd, initial=initial, interval=interval)
+            except OSError:
+                self.close()
+
+    def wait(self):
+        """Blocks until the next tick, or returns at once after interrupt()."""
+        if self._timer_fd is not None:
+            readable, _, _ = select.select([self._timer_fd, self._wake_fd], [], [])
+            if self._timer_fd in readable:
+                # Returns the number of expirations; missed ticks are coalesced into this one.
+                os.read(self._timer_fd, 8)
+            return
+
+        delay = self._next_tick - time.monotonic()
+        if delay > 0:
+            self._interrupted.wait(delay)
+        self._next_tick += self.interval
+
+        # After overrunning a whole period, realign instead of firing catch-up ticks back to back.
+        now = time.monotonic()
+        if self._next_tick < now:
+            self._next_tick = now + self.interval
+
+    def set_interval(self, interval):
+        """Changes the period; the next tick comes one new interval after the last one."""
+        if interval == self.interval:
+            return
+        if self._timer_fd is not None:
+            # Shift the pending expiration like the deadline path does; initial=0 would disarm the timer.
+            remaining, _ = os.timerfd_gettime(self._timer_fd)
+            initial = max(remaining + interval - self.interval, 1e-6)
+            os.timerfd_settime(self._timer_fd, initial=initial, interval=interval)
+        else:
+            self._next_tick += interval - self.interval
+        self.interval = interval
 
-    sys.stdout.flush()
+    def interrupt(self):
+        """Makes the current and every later wait() return immediately, e.g. to stop a polling thread."""
+        self._interrupted.set()
+        if self._wake_fd is not None:
+            os.eventfd_write(self._wake_fd, 1)
+
+    def close(self):
+        for fd in (self._timer_fd, self._wake_fd):
+            if fd is not None:
+                os.close(fd)
+        self._timer_fd = None
+        self._wake_fd = None
+
+
+class AdaptiveInterval:
+    """
+    Picks the poll interval for --adaptive from how much the temperatures moved between
+    consecutive polls. Idle GPUs are polled less often; any real change restores the normal cadence.
+    """
+
+    def __init__(self):
+        self.interval = POLL_INTERVAL
+        self._prev = None
+        self._stable_count = 0
+
+    def update(self, gpu_data):
+        """Feeds one poll result and returns the interval to use until the next poll."""
+        temps = [gpu["current"] for gpu in gpu_data.get("gpu_temps", [])] if gpu_data else []
+        prev, self._prev = self._prev, temps
+
+        if not temps or not prev or len(temps) != len(prev):
+            self._stable_count = 0
+            self.interval = POLL_INTERVAL
+            return self.interval
+
+        max_delta = max(abs(temp - prev_temp) for temp, prev_temp in zip(temps, prev))
+        if max_delta < STABLE_TEMP_DELTA:
+            self._stable_count += 1
+            if self._stable_count >= ADAPTIVE_STABLE_POLLS:
+                self.interval = ADAPTIVE_IDLE_INTERVAL
+        else:
+            self._stable_count = 0
+            if max_delta > RESUME_TEMP_DELTA:
+                self.interval = POLL_INTERVAL
+        return self.interval
+
+
+# Latest snapshot published by the poller thread; the display loop only reads it.
+_latest = {"data": None, "error": None}
+_latest_lock = threading.Lock()
+
+def poll_and_publish(nvml_session, psutil_session):
+    """
+    Reads the sensors once and publishes the result (or the exception) as the latest snapshot.
+    Returns the data, or None if the read raised.
+    """
+    try:
+        gpu_data = get_gpu_data_structured(nvml_session, psutil_session)
+        error = None
+    except Exception as e:
+        gpu_data, error = None, e
+    with _latest_lock:
+        _latest["data"] = gpu_data
+        _latest["error"] = error
+    return gpu_data
+
+def poll_sensors(nvml_session, psutil_session, stop_event, ticker, adaptive=None):
+    """
+    Poller thread body. Slow sensor reads (e.g. hwmon scans) only delay this thread,
+    never the display loop. With an AdaptiveInterval, the poll period follows its decision.
+    To stop it, set stop_event and interrupt the ticker.
+    """
+    while not stop_event.is_set():
+        ticker.wait()
+        if stop_event.is_set():
+            break
+        gpu_data = poll_and_publish(nvml_session, psutil_session)
+        if adaptive is not None:
+            ticker.set_interval(adaptive.update(gpu_data))
 
 
 def main():
@@ -218,14 +628,22 @@ def main():
         action="store_true",
         help="Output a short, single-line version of current temperatures and exit."
     )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help=f"In interactive mode, poll every {ADAPTIVE_IDLE_INTERVAL:g}s instead of {POLL_INTERVAL:g}s while temperatures are stable."
+    )
     args = parser.parse_args()
 
     if args.json and args.short:
         sys.stderr.write("Error: --json and --short arguments are mutually exclusive.\n")
         sys.exit(1)
 
+    nvml_session = NvmlSession()
+    psutil_session = PsutilSession()
+
     if args.json or args.short:
-        gpu_data = get_gpu_data_structured()
+        gpu_data = get_gpu_data_structured(nvml_session, psutil_session, need_timestamp=args.json)
 
         if "error" in gpu_data and not gpu_data.get("gpu_temps"):
             sys.stderr.write(f"{ANSI_RED}Error fetching GPU data: {gpu_data['error']}{ANSI_RESET}\n")
@@ -234,6 +652,7 @@ def main():
             sys.exit(1)
 
         if args.json:
+            import json
             try:
                 json_output = json.dumps(gpu_data, indent=2)
                 sys.stdout.write(json_output + "\n")
@@ -249,32 +668,77 @@ def main():
                 short_output_parts.append("GPU: N/A")
             else:
                 for i, gpu in enumerate(gpu_data["gpu_temps"]):
+                    label_lower = gpu['label'].lower()
                     display_label = gpu['label'].replace('GPU ', 'G') if gpu['label'].startswith('GPU ') else f"G{i+1}"
-                    if 'nvidia' in gpu['label'].lower():
+                    if 'nvidia' in label_lower:
                         display_label = f"NV{i+1}"
-                    elif 'amd' in gpu['label'].lower() or 'radeon' in gpu['label'].lower():
+                    elif 'amd' in label_lower or 'radeon' in label_lower:
                         display_label = f"AMD{i+1}"
-                    
+
                     short_output_parts.append(f"{display_label}: {gpu['current']:.1f}°C")
 
             sys.stdout.write(" | ".join(short_output_parts) + "\n")
             sys.stdout.flush()
             sys.exit(0)
     else:
+        stop_event = threading.Event()
+        poll_ticker = Ticker()
+        poller = None
+        ticker = None
         try:
+            # First snapshot is taken up front so the first frame is never empty.
+            gpu_data_initial = poll_and_publish(nvml_session, psutil_session)
+
+            adaptive = None
+            if args.adaptive:
+                adaptive = AdaptiveInterval()
+                adaptive.update(gpu_data_initial)
+
+            poller = threading.Thread(
+                target=poll_sensors,
+                args=(nvml_session, psutil_session, stop_event, poll_ticker, adaptive),
+                name="gpu-temp-poller",
+                daemon=True
+            )
+            poller.start()
+
+            # A resized terminal may have reflowed the table, so repaint it fully
+            if hasattr(signal, "SIGWINCH"):
+                signal.signal(signal.SIGWINCH, request_full_repaint)
+
+            # Render half a period after each poll so the frame shows the freshest snapshot.
+            ticker = Ticker(initial=POLL_INTERVAL / 2)
             while True:
-                clear_console()
+                with _latest_lock:
+                    gpu_data_live = _latest["data"]
+                    poll_error = _latest["error"]
                 try:
-                    gpu_data_live = get_gpu_data_structured()
-                    display_gpu_temperatures(gpu_data_live)
+                    if poll_error is not None:
+                        request_full_repaint()
+                        sys.stdout.write(f"{CLEAR_SCREEN}{ANSI_RED}An error occurred: {poll_error}{ANSI_RESET}\n")
+                        sys.stdout.flush()
+                    else:
+                        display_gpu_temperatures(gpu_data_live, clear_screen=True, only_changed_rows=True)
                 except Exception as e:
+                    request_full_repaint()
                     sys.stdout.write(f"{ANSI_RED}An error occurred: {e}{ANSI_RESET}\n")
                     sys.stdout.flush()
-                time.sleep(2)
+                ticker.wait()
         except KeyboardInterrupt:
             sys.stdout.write(f"\n{ANSI_CYAN}Monitoring stopped.{ANSI_RESET}\n")
             sys.stdout.flush()
             sys.exit(0)
+        finally:
+            stop_event.set()
+            poll_ticker.interrupt()
+            # A waiting poller exits at once; only an in-flight read is waited for, so the
+            # atexit nvmlShutdown() does not run in the middle of it
+            if poller is not None:
+                poller.join(timeout=POLLER_JOIN_TIMEOUT)
+            if poller is None or not poller.is_alive():
+                poll_ticker.close()
+            if ticker is not None:
+                ticker.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file